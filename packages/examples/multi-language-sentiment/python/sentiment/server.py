@@ -5,33 +5,45 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Callable, Dict
 
-try:
-    from rxpress_bridge import BridgeContext, serve
-except ModuleNotFoundError:  # pragma: no cover
-    import sys
-
-    repo_root = Path(__file__).resolve().parents[3]
-    sys.path.append(str(repo_root / 'rxpress-bridge-python' / 'src'))
-    from rxpress_bridge import BridgeContext, serve  # type: ignore
+if TYPE_CHECKING:  # pragma: no cover
+    from rxpress_bridge import BridgeApp, BridgeContext
 
 LOGGER = logging.getLogger(__name__)
 
-POSITIVE = {"great", "good", "love", "fantastic", "amazing", "happy"}
-NEGATIVE = {"bad", "terrible", "hate", "awful", "sad", "angry"}
+POSITIVE = frozenset({"great", "good", "love", "fantastic", "amazing", "happy"})
+NEGATIVE = frozenset({"bad", "terrible", "hate", "awful", "sad", "angry"})
+SCORES = {**dict.fromkeys(POSITIVE, 1), **dict.fromkeys(NEGATIVE, -1)}
 
+# Compiled once at import; one C-level pass over the text finds every keyword of either polarity,
+# matching whole words only.
+KEYWORDS_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(SCORES))) + r")\b")
+SENTENCE_RE = re.compile(r"[^.!?]+")
 
-def _score(text: str) -> float:
-    lowered = text.lower()
-    score = 0
-    for token in POSITIVE:
-        if token in lowered:
-            score += 1
-    for token in NEGATIVE:
-        if token in lowered:
-            score -= 1
+
+# Only short strings are memoised so the cache never pins large request bodies in memory.
+_CACHE_MAX_CHARS = 256
+
+
+def _score_lowered(lowered: str) -> float:
+    if len(lowered) <= _CACHE_MAX_CHARS:
+        return _score_cached(lowered)
+    return _score(lowered)
+
+
+# Single-sentence messages score the same string twice (whole text + breakdown), and chat-style
+# traffic repeats short messages; lru_cache is thread-safe for concurrent handler threads.
+@lru_cache(maxsize=1024)
+def _score_cached(lowered: str) -> float:
+    return _score(lowered)
+
+
+def _score(lowered: str) -> float:
+    score = sum(SCORES[match] for match in KEYWORDS_RE.findall(lowered))
     if score == 0:
         return 0.0
     return max(-1.0, min(1.0, score / 3))
@@ -41,9 +53,17 @@ def _confidence(score: float) -> float:
     return min(1.0, abs(score)) if score else 0.3
 
 
-def _breakdown(text: str) -> list[dict[str, Any]]:
-    parts = [segment.strip() for segment in text.replace("!", ".").split(".") if segment.strip()]
-    return [{"sentence": part, "score": _score(part)} for part in parts]
+def _sentences(text: str) -> list[str]:
+    # findall yields only the runs between terminators, so no replace/split or empty segments.
+    return [part for part in (segment.strip() for segment in SENTENCE_RE.findall(text)) if part]
+
+
+def _breakdown(text: str, lowered: str) -> list[dict[str, Any]]:
+    # Lowering never introduces or removes '.', '!', '?' or whitespace, so both splits line up.
+    return [
+        {"sentence": part, "score": _score_lowered(lowered_part)}
+        for part, lowered_part in zip(_sentences(text), _sentences(lowered))
+    ]
 
 
 def _normalise_language(value: Any) -> str | None:
@@ -58,9 +78,10 @@ def analyse(_: str, payload: Dict[str, Any], meta: Dict[str, Any], ctx: BridgeCo
     text = str(body.get('text', ''))
     language_hint = _normalise_language(body.get('language'))
 
-    score = _score(text)
+    lowered = text.lower()
+    score = _score_lowered(lowered)
     confidence = _confidence(score)
-    breakdown = _breakdown(text)
+    breakdown = _breakdown(text, lowered)
 
     ctx.log('info', 'sentiment analysed', {
         'score': score,
@@ -82,13 +103,43 @@ def analyse(_: str, payload: Dict[str, Any], meta: Dict[str, Any], ctx: BridgeCo
     }
 
 
+def _import_serve() -> Callable[..., BridgeApp]:
+    # Deferred so importing this module (tests, tooling) does not load grpc or register the
+    # handler_bridge descriptors; only run() needs the bridge.
+    try:
+        from rxpress_bridge import serve
+    except ModuleNotFoundError:  # pragma: no cover
+        import sys
+
+        repo_root = Path(__file__).resolve().parents[3]
+        sys.path.append(str(repo_root / 'rxpress-bridge-python' / 'src'))
+        from rxpress_bridge import serve  # type: ignore
+    return serve
+
+
+def _bridge_workers(value: str | None) -> int | None:
+    """Parse BRIDGE_WORKERS; ``None`` lets the bridge pick its default pool size."""
+    if not value or not value.strip():
+        return None
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        LOGGER.warning('Ignoring BRIDGE_WORKERS=%r; expected a positive integer', value)
+        return None
+    return workers
+
+
 def run() -> None:
     logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+    serve = _import_serve()
 
     bind = os.environ.get('BRIDGE_BIND', '127.0.0.1:50055')
     control_target = os.environ.get('CONTROL_TARGET', '127.0.0.1:50070')
+    workers = _bridge_workers(os.environ.get('BRIDGE_WORKERS'))
 
-    app = serve(bind=bind, handlers={'sentiment.analyse': analyse}, control_target=control_target)
+    app = serve(bind=bind, handlers={'sentiment.analyse': analyse}, control_target=control_target, max_workers=workers)
     LOGGER.info('Sentiment bridge listening on %s (control target %s)', bind, control_target)
 
     try:
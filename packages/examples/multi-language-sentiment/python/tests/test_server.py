@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from sentiment.server import _breakdown, _score_lowered, analyse  # noqa: E402
+
+
+class RecordingContext:
+    def __init__(self) -> None:
+        self.logs: list = []
+
+    def log(self, level, msg, fields=None) -> None:
+        self.logs.append((level, msg, fields))
+
+
+@pytest.mark.parametrize(
+    ('text', 'expected'),
+    [
+        ('goodness gracious', 0.0),
+        ('sadly unhappy', 0.0),
+        ('good', 1 / 3),
+        ('good, good... good!', 1.0),
+        ('good good good good', 1.0),
+        ('bad bad', -2 / 3),
+        ('love it but hate the sad ending', -1 / 3),
+        ('', 0.0),
+    ],
+)
+def test_score_matches_whole_words_per_occurrence(text, expected):
+    assert _score_lowered(text) == pytest.approx(expected)
+
+
+def test_long_inputs_score_like_short_ones():
+    assert _score_lowered('good ' * 100) == 1.0
+    assert _score_lowered('x' * 300 + ' bad') == pytest.approx(-1 / 3)
+
+
+def test_breakdown_splits_on_mixed_terminators():
+    text = 'Great day! Is it bad? Fine.  ...'
+    assert _breakdown(text, text.lower()) == [
+        {'sentence': 'Great day', 'score': pytest.approx(1 / 3)},
+        {'sentence': 'Is it bad', 'score': pytest.approx(-1 / 3)},
+        {'sentence': 'Fine', 'score': 0.0},
+    ]
+
+
+def test_breakdown_keeps_original_casing_for_non_ascii_text():
+    # 'İ'.lower() is two code points, so the lowered copy is longer; sentences must still pair up.
+    text = 'İSTANBUL is GOOD. ÉNORME and SAD! ẞTRASSE'
+    assert len(text.lower()) != len(text)
+    assert _breakdown(text, text.lower()) == [
+        {'sentence': 'İSTANBUL is GOOD', 'score': pytest.approx(1 / 3)},
+        {'sentence': 'ÉNORME and SAD', 'score': pytest.approx(-1 / 3)},
+        {'sentence': 'ẞTRASSE', 'score': 0.0},
+    ]
+
+
+def test_analyse_returns_scored_body_and_logs():
+    ctx = RecordingContext()
+    payload = {'body': {'text': 'I love it. Goodness, the ending was awful!', 'language': ' en '}}
+
+    result = analyse('POST', payload, {'trace_id': 'trace-1'}, ctx)
+
+    assert result == {
+        'status': 200,
+        'body': {
+            'text': 'I love it. Goodness, the ending was awful!',
+            'language': 'en',
+            'polarity': 0.0,
+            'confidence': 0.3,
+            'breakdown': [
+                {'sentence': 'I love it', 'score': pytest.approx(1 / 3)},
+                {'sentence': 'Goodness, the ending was awful', 'score': pytest.approx(-1 / 3)},
+            ],
+            'provider': 'python-bridge-stub',
+        },
+    }
+    assert ctx.logs == [
+        ('info', 'sentiment analysed', {'score': 0.0, 'confidence': 0.3, 'length': 42, 'traceId': 'trace-1'}),
+    ]
+
+
+def test_analyse_handles_missing_body():
+    result = analyse('POST', {}, {}, RecordingContext())
+    assert result['body']['text'] == ''
+    assert result['body']['polarity'] == 0.0
+    assert result['body']['breakdown'] == []
+    assert result['body']['language'] is None
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
-from .control import ControlPlaneClient
+from .control import ControlPlaneClient, _to_meta
+from .generated import handler_bridge_pb2 as bridge_pb
 
 
 @dataclass
@@ -13,22 +15,28 @@ class BridgeContext:
     control: ControlPlaneClient
     meta: Dict[str, Any]
     run_id: Optional[str] = None
+    # Converted once per invocation and reused by every log/emit instead of rebuilt from the dict.
+    _meta_proto: bridge_pb.Meta = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._meta_proto = _to_meta(self.meta)
 
     def log(self, level: str, message: str, fields: Dict[str, Any] | None = None) -> None:
         payload = dict(fields or {})
         if self.run_id and "runId" not in payload:
             payload["runId"] = self.run_id
-        self.control.log(level, message, payload, self.meta)
+        self.control.log(level, message, payload, meta_proto=self._meta_proto)
 
     async def emit(self, topic: str, data: Dict[str, Any]) -> None:
-        # Control plane is synchronous for now; wrap in coroutine for parity with async handlers.
-        self.control.emit(topic, data, self.meta)
+        # Control plane is synchronous for now; wait for the reply off the event loop so concurrent
+        # async handlers sharing the bridge loop are not blocked.
+        await asyncio.to_thread(self.control.emit, topic, data, meta_proto=self._meta_proto)
 
     async def kv_get(self, bucket: str, key: str) -> Any:
-        return self.control.kv_get(bucket, key)
+        return await asyncio.to_thread(self.control.kv_get, bucket, key)
 
     async def kv_put(self, bucket: str, key: str, value: Any, ttl_sec: int | None = None) -> None:
-        self.control.kv_put(bucket, key, value, ttl_sec)
+        await asyncio.to_thread(self.control.kv_put, bucket, key, value, ttl_sec)
 
     async def kv_del(self, bucket: str, key: str) -> None:
-        self.control.kv_del(bucket, key)
+        await asyncio.to_thread(self.control.kv_del, bucket, key)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-import queue
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Iterator, Optional
+from uuid import uuid4
 
 import grpc
 
@@ -48,7 +49,13 @@ class ControlPlaneClient:
         self._stub = bridge_pb2_grpc.ControlPlaneStub(channel)
         self._lock = threading.Lock()
         self._pending: Dict[str, PendingResult] = {}
-        self._outgoing: "queue.Queue[Optional[bridge_pb.Control]]" = queue.Queue()
+        # Outgoing messages wait here until the live stream's request iterator takes them. The
+        # condition guards the deque and the generation, which is bumped whenever a Connect attempt
+        # ends so that attempt's request iterator exits instead of taking messages for a dead call.
+        self._outgoing: Deque[bridge_pb.Control] = deque()
+        self._outgoing_ready = threading.Condition()
+        self._generation = 0
+        self._call: Optional[grpc.Future] = None
         self._stopped = threading.Event()
         self._thread = threading.Thread(target=self._run, name="rxpress-control", daemon=True)
 
@@ -56,14 +63,24 @@ class ControlPlaneClient:
         self._thread.start()
 
     def stop(self) -> None:
-        self._stopped.set()
-        self._outgoing.put(None)
+        with self._outgoing_ready:
+            self._stopped.set()
+            self._outgoing_ready.notify_all()
         self._thread.join(timeout=2)
+        if self._thread.is_alive() and self._call is not None:
+            # Still waiting for rxpress to come up; nothing queued can be delivered, so give up.
+            self._call.cancel()
+            self._thread.join(timeout=1)
 
     def _run(self) -> None:
         while not self._stopped.is_set():
+            with self._outgoing_ready:
+                generation = self._generation
             try:
-                responses = self._stub.Connect(self._request_iterator())
+                # wait_for_ready holds the stream (and anything already queued) until rxpress is
+                # reachable, rather than failing fast and dropping messages the doomed call took.
+                responses = self._stub.Connect(self._request_iterator(generation), wait_for_ready=True)
+                self._call = responses
                 for response in responses:
                     correlation = response.correlation
                     if not correlation:
@@ -72,7 +89,7 @@ class ControlPlaneClient:
                         waiter = self._pending.pop(correlation, None)
                     if waiter:
                         waiter.set(response)
-            except grpc.RpcError as exc:  # pragma: no cover - network failure path
+            except grpc.RpcError as exc:
                 LOGGER.error("control plane stream failed: %s", exc)
                 with self._lock:
                     pending = list(self._pending.values())
@@ -80,65 +97,91 @@ class ControlPlaneClient:
                 for waiter in pending:
                     waiter.set_error(exc)
                 time.sleep(0.5)
-
-    def _request_iterator(self):
-        while not self._stopped.is_set():
-            try:
-                message = self._outgoing.get(timeout=0.1)
-            except queue.Empty:
-                continue
-
-            if message is None:
-                return
+            finally:
+                # However the stream ended (error or clean close), retire its request iterator.
+                with self._outgoing_ready:
+                    self._generation += 1
+                    self._outgoing_ready.notify_all()
+
+    def _request_iterator(self, generation: int) -> Iterator[bridge_pb.Control]:
+        # Block until there is work. The generation is checked before taking a message, so an
+        # iterator whose stream has ended never consumes (or reorders) messages meant for the next
+        # one. On stop() the live iterator drains what is queued, then ends the stream.
+        while True:
+            with self._outgoing_ready:
+                self._outgoing_ready.wait_for(
+                    lambda: self._outgoing or self._stopped.is_set() or generation != self._generation
+                )
+                if generation != self._generation or not self._outgoing:
+                    return
+                message = self._outgoing.popleft()
 
             yield message
 
-    def _queue(self, message: bridge_pb.Control, expect_reply: bool = False) -> PendingResult:
-        correlation = message.correlation or getattr(message, "correlation", None)
-        if not correlation:
-            correlation = __import__("uuid").uuid4().hex
-            message.correlation = correlation
-
-        waiter: Optional[PendingResult] = None
-        if expect_reply:
-            waiter = PendingResult()
-            with self._lock:
-                self._pending[correlation] = waiter
-
-        self._outgoing.put(message)
-        return waiter or PendingResult()
-
-    def log(self, level: str, msg: str, fields: Dict[str, Any] | None = None, meta: Dict[str, Any] | None = None) -> None:
+    def _enqueue(self, message: bridge_pb.Control) -> None:
+        with self._outgoing_ready:
+            self._outgoing.append(message)
+            self._outgoing_ready.notify_all()
+
+    def _send(self, message: bridge_pb.Control) -> None:
+        # Fire-and-forget messages (logs) are never answered, so they skip the correlation id and
+        # waiter that _queue allocates for every request/response exchange.
+        self._enqueue(message)
+
+    def _queue(self, message: bridge_pb.Control) -> PendingResult:
+        correlation = message.correlation or uuid4().hex
+        message.correlation = correlation
+
+        # Register before enqueueing so a fast reply always finds its waiter.
+        waiter = PendingResult()
+        with self._lock:
+            self._pending[correlation] = waiter
+
+        self._enqueue(message)
+        return waiter
+
+    def log(
+        self,
+        level: str,
+        msg: str,
+        fields: Dict[str, Any] | None = None,
+        meta: Dict[str, Any] | None = None,
+        meta_proto: bridge_pb.Meta | None = None,
+    ) -> None:
+        # Sub-messages are given as dicts so the oneof member is filled in place, not built
+        # separately and copied into the Control envelope.
         control = bridge_pb.Control(
-            log=bridge_pb.LogReq(
-                level=level,
-                msg=msg,
-                fields={k: encode_value(v).to_proto() for k, v in (fields or {}).items()},
-            )
+            log={
+                "level": level,
+                "msg": msg,
+                "fields": {k: encode_value(v) for k, v in (fields or {}).items()},
+            }
         )
-        if meta:
-            control.meta.CopyFrom(_to_meta(meta))
-        self._queue(control, expect_reply=False)
-
-    def emit(self, topic: str, data: Dict[str, Any], meta: Dict[str, Any] | None = None) -> None:
+        _apply_meta(control, meta, meta_proto)
+        self._send(control)
+
+    def emit(
+        self,
+        topic: str,
+        data: Dict[str, Any],
+        meta: Dict[str, Any] | None = None,
+        meta_proto: bridge_pb.Meta | None = None,
+    ) -> None:
         control = bridge_pb.Control(
-            emit=bridge_pb.EmitReq(
-                topic=topic,
-                data={k: encode_value(v).to_proto() for k, v in data.items()},
-            )
+            emit={
+                "topic": topic,
+                "data": {k: encode_value(v) for k, v in data.items()},
+            }
         )
-        if meta:
-            control.meta.CopyFrom(_to_meta(meta))
-        waiter = self._queue(control, expect_reply=True)
+        _apply_meta(control, meta, meta_proto)
+        waiter = self._queue(control)
         waiter.wait(timeout=5)
 
     def kv_get(self, bucket: str, key: str) -> Any:
-        control = bridge_pb.Control(
-            kv_get=bridge_pb.KVGetReq(bucket=bucket, key=key)
-        )
-        waiter = self._queue(control, expect_reply=True)
+        control = bridge_pb.Control(kv_get={"bucket": bucket, "key": key})
+        waiter = self._queue(control)
         response = waiter.wait(timeout=5)
-        if response.WhichOneof("oneof_msg") != "kv_get_res":
+        if not response.HasField("kv_get_res"):
             raise RuntimeError("unexpected control-plane response")
         status = response.kv_get_res.status
         if status.code != 0:
@@ -147,34 +190,40 @@ class ControlPlaneClient:
 
     def kv_put(self, bucket: str, key: str, value: Any, ttl_sec: int | None = None) -> None:
         control = bridge_pb.Control(
-            kv_put=bridge_pb.KVPutReq(
-                bucket=bucket,
-                key=key,
-                value=encode_value(value).to_proto(),
-                ttl_sec=ttl_sec or 0,
-            )
+            kv_put={
+                "bucket": bucket,
+                "key": key,
+                "value": encode_value(value),
+                "ttl_sec": ttl_sec or 0,
+            }
         )
-        waiter = self._queue(control, expect_reply=True)
+        waiter = self._queue(control)
         response = waiter.wait(timeout=5)
-        if response.WhichOneof("oneof_msg") != "kv_common_res":
+        if not response.HasField("kv_common_res"):
             raise RuntimeError("unexpected control-plane response")
         status = response.kv_common_res.status
         if status.code != 0:
             raise RuntimeError(status.message or "kv_put failed")
 
     def kv_del(self, bucket: str, key: str) -> None:
-        control = bridge_pb.Control(
-            kv_del=bridge_pb.KVDelReq(bucket=bucket, key=key)
-        )
-        waiter = self._queue(control, expect_reply=True)
+        control = bridge_pb.Control(kv_del={"bucket": bucket, "key": key})
+        waiter = self._queue(control)
         response = waiter.wait(timeout=5)
-        if response.WhichOneof("oneof_msg") != "kv_common_res":
+        if not response.HasField("kv_common_res"):
             raise RuntimeError("unexpected control-plane response")
         status = response.kv_common_res.status
         if status.code != 0:
             raise RuntimeError(status.message or "kv_del failed")
 
 
+def _apply_meta(control: bridge_pb.Control, meta: Dict[str, Any] | None, meta_proto: bridge_pb.Meta | None) -> None:
+    # A prebuilt Meta (see BridgeContext) skips re-walking the dict on every control message.
+    if meta_proto is not None:
+        control.meta.CopyFrom(meta_proto)
+    elif meta:
+        control.meta.CopyFrom(_to_meta(meta))
+
+
 def _to_meta(meta: Dict[str, Any]) -> bridge_pb.Meta:
     message = bridge_pb.Meta()
     if trace := meta.get("trace_id"):
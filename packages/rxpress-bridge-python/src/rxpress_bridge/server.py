@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import logging
+import os
+import threading
 from concurrent import futures
-from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Optional, TypeVar
 
 import grpc
 
@@ -19,20 +24,58 @@ LOGGER = logging.getLogger(__name__)
 
 HandlerFn = Callable[[str, Dict[str, Any], Dict[str, Any], BridgeContext], Awaitable[Dict[str, Any]] | Dict[str, Any]]
 
+T = TypeVar("T")
+
 
 class _BridgeInvoker(bridge_pb2_grpc.InvokerServicer):
     """Hosts the Invoker service and maintains handler registrations."""
 
-    def __init__(self, handlers: Dict[str, HandlerFn], control_target: str) -> None:
+    def __init__(self, handlers: Dict[str, HandlerFn], control_target: str, max_workers: int | None = None) -> None:
         self._handlers = handlers
+        # Blocking handlers get their own pool; the loop's default executor only waits on control-plane
+        # replies, so handler load cannot starve ctx.emit/ctx.kv (and vice versa).
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers or 2 * (os.cpu_count() or 4),
+            thread_name_prefix="bridge-handler",
+        )
         channel = grpc.insecure_channel(control_target)
         self._control = ControlPlaneClient(channel)
         self._control.start()
+        # The aio server and async handlers share one long-lived loop; the public API stays blocking.
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(futures.ThreadPoolExecutor(thread_name_prefix="bridge-control"))
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="rxpress-bridge-loop", daemon=True)
+        self._loop_thread.start()
+        self._stop_lock = threading.Lock()
+        self._stopped = False
 
     def stop(self) -> None:
-        self._control.stop()
-
-    def Invoke(self, request: bridge_pb.InvokeRequest, context: grpc.ServicerContext) -> bridge_pb.InvokeResponse:  # noqa: N802
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        try:
+            self._control.stop()
+        finally:
+            try:
+                # Joins the bridge-control threads that waited on control-plane replies.
+                self.submit(self._loop.shutdown_default_executor())
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join(timeout=2)
+                if not self._loop_thread.is_alive():
+                    self._loop.close()
+                self._executor.shutdown(wait=False)
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the bridge loop and block until it completes."""
+        # A stopped (or closed) loop never picks the coroutine up, so fail instead of blocking forever.
+        if self._loop.is_closed() or not self._loop.is_running():
+            coro.close()
+            raise RuntimeError("bridge event loop is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def Invoke(self, request: bridge_pb.InvokeRequest, context: grpc.aio.ServicerContext) -> bridge_pb.InvokeResponse:  # noqa: N802
         handler = self._handlers.get(request.handler_name)
         response = bridge_pb.InvokeResponse(correlation=request.correlation)
 
@@ -46,14 +89,15 @@ class _BridgeInvoker(bridge_pb2_grpc.InvokerServicer):
         input_map = {k: decode_value(v) for k, v in request.input.items()}
 
         try:
-            result = handler(request.method, input_map, meta, ctx)
-            if hasattr(result, "__await__"):
-                result = _run_sync(result)
-
-            for key, value in (result or {}).items():
-                response.output[key].CopyFrom(encode_value(value).to_proto())
-            response.status.code = 0
-            return response
+            result = await _call_handler(self._executor, handler, request.method, input_map, meta, ctx)
+
+            # Map entries are written once by the constructor rather than created empty and CopyFrom'd.
+            output = {key: encode_value(value) for key, value in (result or {}).items()}
+            return bridge_pb.InvokeResponse(
+                correlation=request.correlation,
+                status=bridge_pb.Status(code=0),
+                output=output,
+            )
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.exception("handler %s failed", request.handler_name)
             response.status.code = 1
@@ -61,12 +105,23 @@ class _BridgeInvoker(bridge_pb2_grpc.InvokerServicer):
             return response
 
 
-def _run_sync(awaitable: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
-    # Minimal async runner—fine for short awaited blocks. A production version may want to use an
-    # event loop or thread pool.
-    import asyncio
+async def _call_handler(
+    executor: futures.Executor,
+    handler: HandlerFn,
+    method: str,
+    payload: Dict[str, Any],
+    meta: Dict[str, Any],
+    ctx: BridgeContext,
+) -> Dict[str, Any]:
+    if inspect.iscoroutinefunction(handler):
+        return await handler(method, payload, meta, ctx)
 
-    return asyncio.run(awaitable)
+    # Plain callables may block (CPU-bound scoring, sync I/O); keep them off the event loop.
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(executor, functools.partial(handler, method, payload, meta, ctx))
+    if inspect.isawaitable(result):
+        result = await result
+    return result
 
 
 def _meta_to_dict(meta: bridge_pb.Meta) -> Dict[str, Any]:
@@ -80,24 +135,40 @@ def _meta_to_dict(meta: bridge_pb.Meta) -> Dict[str, Any]:
 
 @dataclass
 class BridgeApp:
-    server: grpc.Server
+    server: grpc.aio.Server
     invoker: _BridgeInvoker
+    _stop_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _stopped: bool = field(default=False, init=False, repr=False, compare=False)
 
     def wait_forever(self) -> None:
-        self.server.wait_for_termination()
+        if self._stopped:
+            return
+        self.invoker.submit(self.server.wait_for_termination())
 
     def stop(self, grace: float | None = None) -> None:
+        # Safe to call more than once (e.g. a signal handler plus a finally block); only the first
+        # call tears down the server and loop.
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+        # The aio server lives on the invoker loop, so drain it before the loop is stopped.
         try:
-            self.invoker.stop()
+            self.invoker.submit(self.server.stop(grace or 0))
         finally:
-            self.server.stop(grace or 0)
+            self.invoker.stop()
 
 
-def serve(bind: str, handlers: Dict[str, HandlerFn], control_target: str) -> BridgeApp:
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
-    invoker = _BridgeInvoker(handlers, control_target)
+async def _start_server(invoker: _BridgeInvoker, bind: str) -> grpc.aio.Server:
+    server = grpc.aio.server()
     bridge_pb2_grpc.add_InvokerServicer_to_server(invoker, server)
     server.add_insecure_port(bind)
-    server.start()
+    await server.start()
+    return server
+
+
+def serve(bind: str, handlers: Dict[str, HandlerFn], control_target: str, max_workers: int | None = None) -> BridgeApp:
+    invoker = _BridgeInvoker(handlers, control_target, max_workers)
+    server = invoker.submit(_start_server(invoker, bind))
     LOGGER.info("rxpress bridge server listening on %s", bind)
     return BridgeApp(server=server, invoker=invoker)
@@ -2,19 +2,102 @@
 
 rxpress stores primitive/binary/JSON values inside the handler_bridge Value message. These helpers
 allow Python handlers to work with native objects while the bridge handles the wire format.
+
+Structured values are JSON-encoded with msgspec or orjson when installed, falling back to stdlib
+``json`` whenever the fast encoder rejects a payload (then to ``str(value)`` if json rejects it too).
+Payloads the fast encoders accept can still come out differently from ``json.dumps``:
+
+- NaN/Infinity are written as ``null`` (json writes the non-standard ``NaN``/``Infinity``).
+- datetime, date, UUID, dataclass and enum values are serialised natively instead of via ``str()``.
+- msgspec only: nested ``bytes`` become base64 strings and sets/frozensets become arrays.
+- orjson only: when decoding, integers beyond 64 bits are parsed as floats.
+
+Key stringification (int/float/bool/None keys) matches json in every backend.
 """
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Tuple
 
 from .generated import handler_bridge_pb2 as bridge_pb
 
 
+JsonCodec = Tuple[Callable[[Any], str], Callable[[str], Any]]
+
+
+def _msgspec_codec() -> JsonCodec:
+    import msgspec
+
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def msgspec_dumps(value: Any) -> str:
+        return encoder.encode(value).decode()
+
+    return msgspec_dumps, decoder.decode
+
+
+def _orjson_codec() -> JsonCodec:
+    import orjson
+
+    def orjson_dumps(value: Any) -> str:
+        # OPT_NON_STR_KEYS keeps json.dumps behaviour of stringifying int/float/bool/None keys.
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    return orjson_dumps, orjson.loads
+
+
+def _json_codec() -> JsonCodec:
+    """Pick the fastest installed JSON implementation: msgspec, then orjson, then stdlib json.
+
+    Both speed-ups are optional (``pip install rxpress-bridge[msgspec]`` / ``[orjson]``).
+    """
+    for factory in (_msgspec_codec, _orjson_codec):
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return json.dumps, json.loads
+
+
+_dumps, _loads = _json_codec()
+
+
+def _encode_json(value: Any) -> str:
+    try:
+        return _dumps(value)
+    except (TypeError, ValueError):
+        # The fast encoders reject some payloads stdlib json accepts (ints beyond 64 bits, bool/None
+        # keys for msgspec), so retry with json before giving up on the structure.
+        pass
+    try:
+        return json.dumps(value)
+    except (TypeError, ValueError):
+        return json.dumps(str(value))
+
+
+def _decode_json(text: str) -> Any:
+    # json/orjson raise JSONDecodeError and msgspec raises DecodeError; all subclass ValueError. The
+    # fast decoders also reject NaN/Infinity, which json.dumps emits, so retry with json first.
+    try:
+        return _loads(text)
+    except ValueError:
+        pass
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
 @dataclass(slots=True)
 class EncodedValue:
-    """Wrapper that piggybacks on the generated Value message."""
+    """Deprecated wrapper around the generated Value message.
+
+    ``encode_value`` now returns ``bridge_pb.Value`` directly; this class is kept for callers that
+    still wrap values themselves.
+    """
 
     message: bridge_pb.Value
 
@@ -22,7 +105,7 @@ class EncodedValue:
         return self.message
 
 
-def encode_value(value: Any) -> EncodedValue:
+def encode_value(value: Any) -> bridge_pb.Value:
     msg = bridge_pb.Value()
 
     if value is None:
@@ -39,14 +122,9 @@ def encode_value(value: Any) -> EncodedValue:
         msg.f64 = value
     else:
         # Fallback to JSON encoding for dicts, lists, custom objects.
-        import json
+        msg.json = _encode_json(value)
 
-        try:
-            msg.json = json.dumps(value)
-        except (TypeError, ValueError):
-            msg.json = json.dumps(str(value))
-
-    return EncodedValue(msg)
+    return msg
 
 
 def decode_value(message: bridge_pb.Value | None) -> Any:
@@ -66,11 +144,6 @@ def decode_value(message: bridge_pb.Value | None) -> Any:
     if which == "bin":
         return bytes(message.bin)
     if which == "json":
-        import json
-
-        try:
-            return json.loads(message.json)
-        except json.JSONDecodeError:
-            return message.json
+        return _decode_json(message.json)
 
     return None
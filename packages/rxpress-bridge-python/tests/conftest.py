@@ -0,0 +1,73 @@
+import socket
+import sys
+from concurrent import futures
+from pathlib import Path
+
+import grpc
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'src'))
+
+from rxpress_bridge.generated import handler_bridge_pb2 as bridge_pb  # noqa: E402
+from rxpress_bridge.generated import handler_bridge_pb2_grpc as bridge_pb2_grpc  # noqa: E402
+from rxpress_bridge.value_codec import decode_value, encode_value  # noqa: E402
+
+
+class StubControlPlane(bridge_pb2_grpc.ControlPlaneServicer):
+    """In-memory stand-in for the rxpress control plane (mirrors grpc.service.ts Connect)."""
+
+    def __init__(self) -> None:
+        self.kv: dict = {}
+        self.logs: list = []
+        self.emits: list = []
+
+    def Connect(self, request_iterator, context):  # noqa: N802
+        for message in request_iterator:
+            kind = message.WhichOneof("oneof_msg")
+            if kind == "log":
+                self.logs.append((message.log.msg, message.meta.trace_id))
+                continue
+            if kind == "emit":
+                self.emits.append((message.emit.topic, {k: decode_value(v) for k, v in message.emit.data.items()}))
+                reply = bridge_pb.Control(kv_common_res={})
+            elif kind == "kv_get":
+                value = self.kv.get((message.kv_get.bucket, message.kv_get.key))
+                reply = bridge_pb.Control(kv_get_res={"value": encode_value(value)})
+            elif kind == "kv_put":
+                self.kv[(message.kv_put.bucket, message.kv_put.key)] = decode_value(message.kv_put.value)
+                reply = bridge_pb.Control(kv_common_res={})
+            elif kind == "kv_del":
+                self.kv.pop((message.kv_del.bucket, message.kv_del.key), None)
+                reply = bridge_pb.Control(kv_common_res={})
+            else:
+                continue
+            reply.correlation = message.correlation
+            yield reply
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def control_plane():
+    """Returns ``start(port=0, stub=None) -> (stub, target)``; servers are stopped at teardown."""
+    servers = []
+
+    def start(port: int = 0, stub: StubControlPlane | None = None):
+        stub = stub or StubControlPlane()
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        bridge_pb2_grpc.add_ControlPlaneServicer_to_server(stub, server)
+        try:
+            bound = server.add_insecure_port(f"127.0.0.1:{port}")
+        except RuntimeError as exc:
+            pytest.skip(f"cannot listen on localhost: {exc}")
+        server.start()
+        servers.append(server)
+        return stub, f"127.0.0.1:{bound}"
+
+    yield start
+    for server in servers:
+        server.stop(0)
@@ -0,0 +1,105 @@
+import sys
+import time
+
+import grpc
+
+from conftest import StubControlPlane, free_port
+from rxpress_bridge.control import ControlPlaneClient
+
+
+class ClosesFirstStream(StubControlPlane):
+    """Ends the first Connect cleanly (no error), then behaves like the normal stub."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.connects = 0
+
+    def Connect(self, request_iterator, context):  # noqa: N802
+        self.connects += 1
+        if self.connects == 1:
+            return iter(())
+        return super().Connect(request_iterator, context)
+
+
+def _wait_for_logs(stub, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while len(stub.logs) < count and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return [msg for msg, _ in stub.logs]
+
+
+def _request_iterators():
+    """Request iterator generators currently parked on a thread (live or orphaned)."""
+    frames = sys._current_frames().values()
+    count = 0
+    for frame in frames:
+        while frame is not None:
+            if frame.f_code is ControlPlaneClient._request_iterator.__code__:
+                count += 1
+            frame = frame.f_back
+    return count
+
+
+def _connect_after_outage(control_plane, during_outage=()):
+    port = free_port()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    client = ControlPlaneClient(channel)
+    client.start()
+    for msg in during_outage:
+        client.log("info", msg, {})
+    # Keep the control plane down for a while, then bring it up on the same port.
+    time.sleep(2)
+    stub, _ = control_plane(port)
+    grpc.channel_ready_future(channel).result(timeout=10)
+    return client, stub
+
+
+def test_stop_after_reconnect(control_plane):
+    client, stub = _connect_after_outage(control_plane)
+
+    client.log("info", "after reconnect", {})
+    assert _wait_for_logs(stub, 1) == ["after reconnect"]
+
+    started = time.monotonic()
+    client.stop()
+    assert not client._thread.is_alive()
+    assert time.monotonic() - started < 1.5
+
+
+def test_reconnect_keeps_order_and_retires_orphans(control_plane):
+    expected = [f"m{i}" for i in range(10)]
+    client, stub = _connect_after_outage(control_plane, during_outage=expected[:5])
+    try:
+        for msg in expected[5:]:
+            client.log("info", msg, {})
+        assert _wait_for_logs(stub, len(expected)) == expected
+        # Only the live stream's iterator is left; no earlier attempt is parked on the queue.
+        assert _request_iterators() <= 1
+    finally:
+        client.stop()
+
+
+def test_clean_stream_close_does_not_drop_messages(control_plane):
+    stub, target = control_plane(stub=ClosesFirstStream())
+    client = ControlPlaneClient(grpc.insecure_channel(target))
+    client.start()
+    try:
+        deadline = time.monotonic() + 5
+        while stub.connects < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        expected = [f"m{i}" for i in range(4)]
+        for msg in expected:
+            client.log("info", msg, {})
+        assert _wait_for_logs(stub, len(expected)) == expected
+    finally:
+        client.stop()
+
+
+def test_stop_while_control_plane_is_down():
+    client = ControlPlaneClient(grpc.insecure_channel(f"127.0.0.1:{free_port()}"))
+    client.start()
+    client.log("info", "never delivered", {})
+    time.sleep(0.5)
+
+    client.stop()
+    assert not client._thread.is_alive()
@@ -0,0 +1,87 @@
+import threading
+
+import grpc
+import pytest
+
+from conftest import free_port
+from rxpress_bridge import serve
+from rxpress_bridge.generated import handler_bridge_pb2 as bridge_pb
+from rxpress_bridge.generated import handler_bridge_pb2_grpc as bridge_pb2_grpc
+from rxpress_bridge.value_codec import decode_value, encode_value
+
+
+def sync_handler(method, payload, meta, ctx):
+    ctx.log("info", "sync handler")
+    return {"status": 200, "body": {"method": method, "echo": payload.get("body")}}
+
+
+async def async_handler(method, payload, meta, ctx):
+    await ctx.kv_put("bucket", "key", {"n": 1})
+    stored = await ctx.kv_get("bucket", "key")
+    await ctx.emit("scored", {"value": stored["n"]})
+    return {"status": 201, "body": {"stored": stored}}
+
+
+def test_serve_invokes_handlers_and_stops(control_plane):
+    stub, control_target = control_plane()
+    bind = f"127.0.0.1:{free_port()}"
+    app = serve(
+        bind=bind,
+        handlers={"demo.sync": sync_handler, "demo.async": async_handler},
+        control_target=control_target,
+    )
+    try:
+        invoker = bridge_pb2_grpc.InvokerStub(grpc.insecure_channel(bind))
+
+        def invoke(name, body=None):
+            request = bridge_pb.InvokeRequest(
+                handler_name=name,
+                method="POST",
+                correlation="c-1",
+                meta={"trace_id": "trace-1"},
+                input={"body": encode_value(body)},
+            )
+            response = invoker.Invoke(request, timeout=10)
+            assert response.correlation == "c-1"
+            return response.status, {k: decode_value(v) for k, v in response.output.items()}
+
+        status, output = invoke("demo.sync", {"text": "hi"})
+        assert status.code == 0
+        assert output == {"status": 200, "body": {"method": "POST", "echo": {"text": "hi"}}}
+
+        status, output = invoke("demo.async")
+        assert status.code == 0
+        assert output == {"status": 201, "body": {"stored": {"n": 1}}}
+        assert stub.emits == [("scored", {"value": 1})]
+        # Logs are fire-and-forget; the emit reply above means the stub has consumed the earlier log.
+        assert stub.logs == [("sync handler", "trace-1")]
+
+        status, output = invoke("demo.missing")
+        assert status.code == 1
+        assert status.message == "handler not found: demo.missing"
+        assert output == {}
+
+        waiter = threading.Thread(target=app.wait_forever, daemon=True)
+        waiter.start()
+    finally:
+        app.stop(grace=0.5)
+
+    waiter.join(timeout=3)
+    assert not waiter.is_alive()
+    # A second stop (signal handler + finally) is a no-op, and waiting on a stopped app returns.
+    app.stop()
+    app.wait_forever()
+    assert app.invoker._loop.is_closed()
+    assert not [t.name for t in threading.enumerate() if t.name.startswith("bridge-control")]
+
+
+def test_submit_fails_once_the_loop_has_stopped(control_plane):
+    _, control_target = control_plane()
+    app = serve(bind=f"127.0.0.1:{free_port()}", handlers={}, control_target=control_target)
+    app.stop()
+
+    async def noop():
+        return None
+
+    with pytest.raises(RuntimeError, match="not running"):
+        app.invoker.submit(noop())
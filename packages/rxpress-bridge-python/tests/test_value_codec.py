@@ -0,0 +1,73 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / 'src'))
+
+from rxpress_bridge import value_codec  # noqa: E402
+from rxpress_bridge.value_codec import decode_value, encode_value  # noqa: E402
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def json_backend(request, monkeypatch):
+    """Run a test against each (dumps, loads) pair _json_codec() may pick."""
+    if request.param == "json":
+        codec = (json.dumps, json.loads)
+    else:
+        pytest.importorskip(request.param)
+        codec = getattr(value_codec, f"_{request.param}_codec")()
+    monkeypatch.setattr(value_codec, "_dumps", codec[0])
+    monkeypatch.setattr(value_codec, "_loads", codec[1])
+    return request.param
+
+
+def test_primitive_round_trip():
+    for value in ("text", 42, 1.5, True, False, b"\x00\x01"):
+        decoded = decode_value(encode_value(value))
+        assert decoded == value
+        assert type(decoded) is type(value)
+
+
+def test_bool_is_not_encoded_as_int():
+    assert encode_value(True).WhichOneof("v") == "b"
+    assert encode_value(1).WhichOneof("v") == "i64"
+
+
+def test_structured_and_none_round_trip(json_backend):
+    payload = {"body": {"text": "hi", "scores": [1, 2.5, None]}, "ok": True}
+    assert decode_value(encode_value(payload)) == payload
+    assert decode_value(encode_value({1: "a"})) == {"1": "a"}
+    assert decode_value(encode_value(None)) is None
+    assert decode_value(None) is None
+
+
+def test_unserialisable_values_fall_back_to_str(json_backend):
+    value = object()
+    assert decode_value(encode_value(value)) == str(value)
+    assert decode_value(value_codec.bridge_pb.Value(json="{not json")) == "{not json"
+
+
+def test_big_ints_keep_their_json_encoding(json_backend):
+    big = [2**70]
+    assert encode_value(big).json == json.dumps(big)
+    if json_backend != "orjson":  # orjson.loads parses ints beyond 64 bits as floats
+        assert decode_value(encode_value(big)) == big
+
+
+def test_nan_from_stdlib_json_still_decodes(json_backend):
+    decoded = decode_value(value_codec.bridge_pb.Value(json="[NaN]"))
+    assert decoded[0] != decoded[0]
+
+
+def test_bool_and_none_keys_are_stringified(json_backend):
+    assert decode_value(encode_value({True: 1, None: 2})) == {"true": 1, "null": 2}
+
+
+def test_nested_bytes(json_backend):
+    decoded = decode_value(encode_value({"raw": b"ab"}))
+    if json_backend == "msgspec":  # documented difference: msgspec base64-encodes nested bytes
+        assert decoded == {"raw": "YWI="}
+    else:
+        assert decoded == str({"raw": b"ab"})